@@ -634,6 +634,7 @@ class DagRun(Base, LoggingMixin):
 
         tis = list(self.get_task_instances(session=session, state=State.task_states))
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
+        removed_tis = False
         for ti in tis:
             try:
                 ti.task = self.get_dag().get_task(ti.task_id)
@@ -642,7 +643,11 @@ class DagRun(Base, LoggingMixin):
                     "Failed to get task '%s' for dag '%s'. Marking it as removed.", ti, ti.dag_id
                 )
                 ti.state = State.REMOVED
-                session.flush()
+                removed_tis = True
+        # Flush once for all removed TIs rather than once per TI; nothing in the loop above reads
+        # them back from the database, only the dependency checks below do.
+        if removed_tis:
+            session.flush()
 
         unfinished_tasks = [t for t in tis if t.state in State.unfinished]
         finished_tasks = [t for t in tis if t.state in State.finished]
@@ -740,9 +745,7 @@ class DagRun(Base, LoggingMixin):
                 # We can't emit this metric if there is no following schedule to calculate from!
                 return
 
-            ordered_tis_by_start_date = [ti for ti in finished_tis if ti.start_date]
-            ordered_tis_by_start_date.sort(key=lambda ti: ti.start_date, reverse=False)
-            first_start_date = ordered_tis_by_start_date[0].start_date
+            first_start_date = min((ti.start_date for ti in finished_tis if ti.start_date), default=None)
             if first_start_date:
                 # TODO: Logically, this should be DagRunInfo.run_after, but the
                 # information is not stored on a DagRun, only before the actual